@@ -392,6 +392,8 @@ class ScatterMaskToolsWidget(BaseMaskToolsWidget):
         extension = extension.lower()[1:]
         if extension == "npy":
             try:
+                # Not memory-mapped: the loaded array is used as is as the
+                # mask, which is updated in place
                 mask = numpy.load(filename)
             except IOError:
                 _logger.error("Can't load filename '%s'", filename)
@@ -150,36 +150,23 @@ class SaveAction(PlotAction):
                               SCATTER_FILTER_NXDATA)
 
     def __init__(self, plot, parent=None):
+        # Initialize filters
         self._filters = {
-            'all': OrderedDict(),
-            'curve': OrderedDict(),
-            'curves': OrderedDict(),
-            'image': OrderedDict(),
-            'scatter': OrderedDict()}
+            'all': OrderedDict.fromkeys(
+                self.DEFAULT_ALL_FILTERS, self._saveSnapshot),
+            'curve': OrderedDict.fromkeys(
+                self.DEFAULT_CURVE_FILTERS, self._saveCurve),
+            'curves': OrderedDict.fromkeys(
+                self.DEFAULT_ALL_CURVES_FILTERS, self._saveCurves),
+            'image': OrderedDict.fromkeys(
+                self.DEFAULT_IMAGE_FILTERS, self._saveImage),
+            'scatter': OrderedDict.fromkeys(
+                self.DEFAULT_SCATTER_FILTERS, self._saveScatter)}
+        self._filterIndices = {}
+        """Cache of {nameFilter: index} for each kind of data"""
 
         self._appendFilters = list(self.DEFAULT_APPEND_FILTERS)
 
-        # Initialize filters
-        for nameFilter in self.DEFAULT_ALL_FILTERS:
-            self.setFileFilter(
-                dataKind='all', nameFilter=nameFilter, func=self._saveSnapshot)
-
-        for nameFilter in self.DEFAULT_CURVE_FILTERS:
-            self.setFileFilter(
-                dataKind='curve', nameFilter=nameFilter, func=self._saveCurve)
-
-        for nameFilter in self.DEFAULT_ALL_CURVES_FILTERS:
-            self.setFileFilter(
-                dataKind='curves', nameFilter=nameFilter, func=self._saveCurves)
-
-        for nameFilter in self.DEFAULT_IMAGE_FILTERS:
-            self.setFileFilter(
-                dataKind='image', nameFilter=nameFilter, func=self._saveImage)
-
-        for nameFilter in self.DEFAULT_SCATTER_FILTERS:
-            self.setFileFilter(
-                dataKind='scatter', nameFilter=nameFilter, func=self._saveScatter)
-
         super(SaveAction, self).__init__(
             plot, icon='document-save', text='Save as...',
             tooltip='Save curve/image/plot snapshot dialog',
@@ -555,6 +542,8 @@ class SaveAction(PlotAction):
         """
         assert dataKind in ('all', 'curve', 'curves', 'image', 'scatter')
 
+        self._filterIndices.pop(dataKind, None)
+
         if appendToFile:
             self._appendFilters.append(nameFilter)
 
@@ -606,6 +595,29 @@ class SaveAction(PlotAction):
 
         return self._filters[dataKind].copy()
 
+    def getFileFilterIndex(self, dataKind, nameFilter):
+        """Returns the position of a name filter for a kind of data.
+
+        :param str dataKind:
+            The kind of data for which the provided filter is valid.
+            On of: 'all', 'curve', 'curves', 'image', 'scatter'
+        :param str nameFilter: The name filter in the QFileDialog.
+        :return: Index of the name filter in :meth:`getFileFilters` order
+        :rtype: int
+        :raise ValueError: If nameFilter is not set for this kind of data
+        """
+        assert dataKind in ('all', 'curve', 'curves', 'image', 'scatter')
+
+        indices = self._filterIndices.get(dataKind)
+        if indices is None:
+            indices = dict((name, index) for index, name in
+                           enumerate(self._filters[dataKind]))
+            self._filterIndices[dataKind] = indices
+
+        if nameFilter not in indices:
+            raise ValueError("No file filter %s for %s" % (nameFilter, dataKind))
+        return indices[nameFilter]
+
     def _actionTriggered(self, checked=False):
         """Handle save action."""
         # Set-up filters
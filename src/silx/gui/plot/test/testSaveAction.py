@@ -29,6 +29,7 @@ __license__ = "MIT"
 __date__ = "28/11/2017"
 
 
+import re
 import unittest
 import tempfile
 import os
@@ -39,6 +40,24 @@ from silx.gui.plot import PlotWidget
 from silx.gui.plot.actions.io import SaveAction
 
 
+_SPEC_HEADERS = (
+    # case with all curve labels specified
+    b"#S 1 curve0 Y",
+    b"#L curve0 X  curve0 Y",
+    # graph X&Y labels are used when no curve label is specified
+    b"#S 2 graph y label",
+    b"#L curve1 X  graph y label",
+    b"#S 3 curve2 Y",
+    b"#L graph x label  curve2 Y",
+    b"#S 4 graph y label",
+    b"#L graph x label  graph y label",
+)
+"""Headers expected in the SpecFile saved by testSaveMultipleCurvesAsSpec"""
+
+_SPEC_HEADERS_PATTERN = re.compile(b"|".join(
+    re.escape(header) for header in _SPEC_HEADERS))
+
+
 class TestSaveActionSaveCurvesAsSpec(unittest.TestCase):
 
     def setUp(self):
@@ -57,13 +76,16 @@ class TestSaveActionSaveCurvesAsSpec(unittest.TestCase):
         self.plot.setGraphXLabel("graph x label")
         self.plot.setGraphYLabel("graph y label")
 
+        # No need to reset the zoom for each curve: limits are not saved
         self.plot.addCurve([0, 1], [1, 2], "curve with labels",
-                           xlabel="curve0 X", ylabel="curve0 Y")
+                           xlabel="curve0 X", ylabel="curve0 Y",
+                           resetzoom=False)
         self.plot.addCurve([-1, 3], [-6, 2], "curve with X label",
-                           xlabel="curve1 X")
+                           xlabel="curve1 X", resetzoom=False)
         self.plot.addCurve([-2, 0], [8, 12], "curve with Y label",
-                           ylabel="curve2 Y")
-        self.plot.addCurve([3, 1], [7, 6], "curve with no labels")
+                           ylabel="curve2 Y", resetzoom=False)
+        self.plot.addCurve([3, 1], [7, 6], "curve with no labels",
+                           resetzoom=False)
 
         self.saveAction._saveCurves(self.plot,
                                     self.out_fname,
@@ -71,22 +93,10 @@ class TestSaveActionSaveCurvesAsSpec(unittest.TestCase):
 
         with open(self.out_fname, "rb") as f:
             file_content = f.read()
-            if hasattr(file_content, "decode"):
-                file_content = file_content.decode()
-
-            # case with all curve labels specified
-            self.assertIn("#S 1 curve0 Y", file_content)
-            self.assertIn("#L curve0 X  curve0 Y", file_content)
 
-            # graph X&Y labels are used when no curve label is specified
-            self.assertIn("#S 2 graph y label", file_content)
-            self.assertIn("#L curve1 X  graph y label", file_content)
-
-            self.assertIn("#S 3 curve2 Y", file_content)
-            self.assertIn("#L graph x label  curve2 Y", file_content)
-
-            self.assertIn("#S 4 graph y label", file_content)
-            self.assertIn("#L graph x label  graph y label", file_content)
+        found = set(_SPEC_HEADERS_PATTERN.findall(file_content))
+        missing = [header for header in _SPEC_HEADERS if header not in found]
+        self.assertEqual(missing, [])
 
 
 class TestSaveActionExtension(PlotWidgetTestCase):
@@ -113,7 +123,7 @@ class TestSaveActionExtension(PlotWidgetTestCase):
         self.assertTrue(nameFilter in saveAction.getFileFilters('all'))
         filters = saveAction.getFileFilters('all')
         self.assertEqual(filters[nameFilter], self._dummySaveFunction)
-        self.assertEqual(list(filters.keys()).index(nameFilter),3)
+        self.assertEqual(saveAction.getFileFilterIndex('all', nameFilter), 3)
 
         # Update an existing file filter
         nameFilter = SaveAction.IMAGE_FILTER_EDF
@@ -123,14 +133,19 @@ class TestSaveActionExtension(PlotWidgetTestCase):
 
         # Change the position of an existing file filter
         nameFilter = 'Dummy file2 (*.dummy)'
-        oldIndex = list(saveAction.getFileFilters('all')).index(nameFilter)
+        oldIndex = saveAction.getFileFilterIndex('all', nameFilter)
         newIndex = oldIndex - 1
         saveAction.setFileFilter('all', nameFilter,
                                  self._dummySaveFunction, index=newIndex)
         filters = saveAction.getFileFilters('all')
         self.assertEqual(filters[nameFilter], self._dummySaveFunction)
+        self.assertEqual(saveAction.getFileFilterIndex('all', nameFilter),
+                         newIndex)
         self.assertEqual(list(filters.keys()).index(nameFilter), newIndex)
 
+        with self.assertRaises(ValueError):
+            saveAction.getFileFilterIndex('image', 'Unknown (*.unknown)')
+
 def suite():
     test_suite = unittest.TestSuite()
     for cls in (TestSaveActionSaveCurvesAsSpec, TestSaveActionExtension):
@@ -32,6 +32,7 @@ __date__ = "17/01/2018"
 import logging
 import os.path
 import unittest
+import weakref
 
 import numpy
 
@@ -39,8 +40,9 @@ from silx.gui import qt
 from silx.test.utils import temp_dir
 from silx.utils.testutils import ParametricTestCase
 from silx.gui.utils.testutils import getQToolButtonFromAction
+from silx.gui.utils.testutils import TestCaseQt
+from silx.gui.utils.testutils import qWaitForWindowExposedAndActivate
 from silx.gui.plot import PlotWindow, ScatterMaskToolsWidget
-from .utils import PlotWidgetTestCase
 
 import fabio
 
@@ -48,32 +50,82 @@ import fabio
 _logger = logging.getLogger(__name__)
 
 
-class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
-    """Basic test for MaskToolsWidget"""
+_random = numpy.random.RandomState(0)
 
-    def _createPlot(self):
-        return PlotWindow()
+_X256 = numpy.arange(256)
+_VALUES256 = _random.random_sample(256)
 
-    def setUp(self):
-        super(TestScatterMaskToolsWidget, self).setUp()
-        self.widget = ScatterMaskToolsWidget.ScatterMaskToolsDockWidget(
-                plot=self.plot, name='TEST')
-        self.plot.addDockWidget(qt.Qt.BottomDockWidgetArea, self.widget)
+_X1000 = numpy.arange(1000)
+_Y1000 = 1000 * (_X1000 % 20)
+_VALUES1000 = _random.random_sample(1000)
+
+
+class TestScatterMaskToolsWidget(TestCaseQt, ParametricTestCase):
+    """Basic test for MaskToolsWidget
+
+    The PlotWindow and its mask dock widget are created once for the class
+    and reset before each test.
+    """
 
-        self.maskWidget = self.widget.widget()
+    @classmethod
+    def setUpClass(cls):
+        super(TestScatterMaskToolsWidget, cls).setUpClass()
+        cls.plot = PlotWindow()
+        cls.widget = ScatterMaskToolsWidget.ScatterMaskToolsDockWidget(
+                plot=cls.plot, name='TEST')
+        cls.plot.addDockWidget(qt.Qt.BottomDockWidgetArea, cls.widget)
 
-    def tearDown(self):
-        del self.maskWidget
-        del self.widget
-        super(TestScatterMaskToolsWidget, self).tearDown()
+        cls.maskWidget = cls.widget.widget()
+        cls._defaultPencilWidth = cls.maskWidget.pencilSpinBox.value()
+        cls._toolButtons = {}
+
+        cls.plot.show()
+        qWaitForWindowExposedAndActivate(cls.plot)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.plot.close()
+        ref = weakref.ref(cls.plot)
+        del cls._toolButtons
+        del cls.maskWidget
+        del cls.widget
+        del cls.plot
+        cls.qWaitForDestroy(ref)
+        super(TestScatterMaskToolsWidget, cls).tearDownClass()
+
+    def setUp(self):
+        super(TestScatterMaskToolsWidget, self).setUp()
+        maskWidget = self.maskWidget
+        if self.plot.getActiveScatter() is not None:
+            # The mask can only be reset while a scatter is active
+            maskWidget.resetSelectionMask()
+        self.plot.clear()
+        self.plot.resetZoom()
+        maskWidget.setMultipleMasks('exclusive')
+        maskWidget.browseAction.trigger()
+        # The widget is disabled without scatter: do not click
+        maskWidget.maskStateGroup.button(1).setChecked(True)  # mask mode
+        maskWidget.pencilSpinBox.setValue(self._defaultPencilWidth)
+
+    def _getToolButton(self, action):
+        """Returns the QToolButton of an action of the shared mask widget"""
+        if action not in self._toolButtons:
+            self._toolButtons[action] = getQToolButtonFromAction(action)
+        return self._toolButtons[action]
+
+    def _settle(self):
+        """Run the event loop once to let the plot handle pending updates"""
+        loop = qt.QEventLoop()
+        qt.QTimer.singleShot(0, loop.quit)
+        loop.exec_()
 
     def testEmptyPlot(self):
         """Empty plot, display MaskToolsDockWidget, toggle multiple masks"""
         self.maskWidget.setMultipleMasks('single')
-        self.qapp.processEvents()
+        self._settle()
 
         self.maskWidget.setMultipleMasks('exclusive')
-        self.qapp.processEvents()
+        self._settle()
 
     def _drag(self):
         """Drag from plot center to offset position"""
@@ -86,15 +138,11 @@ class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
 
         self.mouseMove(plot, pos=(0, 0))
         self.mouseMove(plot, pos=pos0)
-        self.qapp.processEvents()
         self.mousePress(plot, qt.Qt.LeftButton, pos=pos0)
-        self.qapp.processEvents()
 
         self.mouseMove(plot, pos=(pos0[0] + offset // 2, pos0[1] + offset // 2))
         self.mouseMove(plot, pos=pos1)
-        self.qapp.processEvents()
         self.mouseRelease(plot, qt.Qt.LeftButton, pos=pos1)
-        self.qapp.processEvents()
         self.mouseMove(plot, pos=(0, 0))
 
     def _drawPolygon(self):
@@ -113,11 +161,8 @@ class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
         self.mouseMove(plot, pos=[0, 0])
         for pos in star:
             self.mouseMove(plot, pos=pos)
-            self.qapp.processEvents()
             self.mousePress(plot, qt.Qt.LeftButton, pos=pos)
-            self.qapp.processEvents()
             self.mouseRelease(plot, qt.Qt.LeftButton, pos=pos)
-            self.qapp.processEvents()
 
     def _drawPencil(self):
         """Draw a star polygon in the plot"""
@@ -139,128 +184,101 @@ class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
         self.mouseRelease(
             plot, qt.Qt.LeftButton, pos=star[-1])
 
-    def testWithAScatter(self):
-        """Plot with a Scatter: test MaskToolsWidget interactions"""
-
+    def _addScatter(self):
+        """Add a scatter to the plot and make it active"""
         # Add and remove a scatter (this should enable/disable GUI + change mask)
         self.plot.addScatter(
-                x=numpy.arange(256),
-                y=numpy.arange(256),
-                value=numpy.random.random(256),
+                x=_X256,
+                y=_X256,
+                value=_VALUES256,
                 legend='test')
         self.plot._setActiveItem(kind="scatter", legend="test")
-        self.qapp.processEvents()
 
         self.plot.remove('test', kind='scatter')
-        self.qapp.processEvents()
 
         self.plot.addScatter(
-                x=numpy.arange(1000),
-                y=1000 * (numpy.arange(1000) % 20),
-                value=numpy.random.random(1000),
+                x=_X1000,
+                y=_Y1000,
+                value=_VALUES1000,
                 legend='test')
         self.plot._setActiveItem(kind="scatter", legend="test")
         self.plot.resetZoom()
-        self.qapp.processEvents()
-
-        # Test draw rectangle #
-        toolButton = getQToolButtonFromAction(self.maskWidget.rectAction)
-        self.assertIsNot(toolButton, None)
-        self.mouseClick(toolButton, qt.Qt.LeftButton)
-
-        # mask
-        self.maskWidget.maskStateGroup.button(1).click()
-        self.qapp.processEvents()
-        self._drag()
+        self._settle()
 
-        self.assertFalse(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+    def _testDrawTool(self, action, draw):
+        """Mask and unmask the same region with a drawing tool
 
-        # unmask same region
-        self.maskWidget.maskStateGroup.button(0).click()
-        self.qapp.processEvents()
-        self._drag()
-        self.assertTrue(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+        :param QAction action: The action selecting the drawing tool
+        :param callable draw: Function performing the drawing in the plot
+        """
+        maskWidget = self.maskWidget
+        maskStateGroup = maskWidget.maskStateGroup
 
-        # Test draw polygon #
-        toolButton = getQToolButtonFromAction(self.maskWidget.polygonAction)
+        toolButton = self._getToolButton(action)
         self.assertIsNot(toolButton, None)
         self.mouseClick(toolButton, qt.Qt.LeftButton)
 
         # mask
-        self.maskWidget.maskStateGroup.button(1).click()
-        self.qapp.processEvents()
-        self._drawPolygon()
-        self.assertFalse(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+        maskStateGroup.button(1).click()
+        draw()
+        self.assertTrue(maskWidget.getSelectionMask().any())
 
         # unmask same region
-        self.maskWidget.maskStateGroup.button(0).click()
-        self.qapp.processEvents()
-        self._drawPolygon()
-        self.assertTrue(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+        maskStateGroup.button(0).click()
+        draw()
+        self.assertFalse(maskWidget.getSelectionMask().any())
 
-        # Test draw pencil #
-        toolButton = getQToolButtonFromAction(self.maskWidget.pencilAction)
+        # Test no draw tool #
+        toolButton = self._getToolButton(maskWidget.browseAction)
         self.assertIsNot(toolButton, None)
         self.mouseClick(toolButton, qt.Qt.LeftButton)
 
-        self.maskWidget.pencilSpinBox.setValue(30)
-        self.qapp.processEvents()
+    def testWithAScatterRectangle(self):
+        """Plot with a Scatter: test MaskToolsWidget rectangle tool"""
+        self._addScatter()
+        self._testDrawTool(self.maskWidget.rectAction, self._drag)
 
-        # mask
-        self.maskWidget.maskStateGroup.button(1).click()
-        self.qapp.processEvents()
-        self._drawPencil()
-        self.assertFalse(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+    def testWithAScatterPolygon(self):
+        """Plot with a Scatter: test MaskToolsWidget polygon tool"""
+        self._addScatter()
+        self._testDrawTool(self.maskWidget.polygonAction, self._drawPolygon)
 
-        # unmask same region
-        self.maskWidget.maskStateGroup.button(0).click()
-        self.qapp.processEvents()
-        self._drawPencil()
-        self.assertTrue(
-            numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
-
-        # Test no draw tool #
-        toolButton = getQToolButtonFromAction(self.maskWidget.browseAction)
-        self.assertIsNot(toolButton, None)
-        self.mouseClick(toolButton, qt.Qt.LeftButton)
-
-        self.plot.clear()
+    def testWithAScatterPencil(self):
+        """Plot with a Scatter: test MaskToolsWidget pencil tool"""
+        self._addScatter()
+        self.maskWidget.pencilSpinBox.setValue(30)
+        self._testDrawTool(self.maskWidget.pencilAction, self._drawPencil)
 
     def __loadSave(self, file_format):
+        maskWidget = self.maskWidget
         self.plot.addScatter(
-                x=numpy.arange(256),
-                y=25 * (numpy.arange(256) % 10),
-                value=numpy.random.random(256),
+                x=_X256,
+                y=25 * (_X256 % 10),
+                value=_VALUES256,
                 legend='test')
         self.plot._setActiveItem(kind="scatter", legend="test")
         self.plot.resetZoom()
-        self.qapp.processEvents()
+        self._settle()
 
         # Draw a polygon mask
-        toolButton = getQToolButtonFromAction(self.maskWidget.polygonAction)
+        toolButton = self._getToolButton(maskWidget.polygonAction)
         self.assertIsNot(toolButton, None)
         self.mouseClick(toolButton, qt.Qt.LeftButton)
         self._drawPolygon()
 
-        ref_mask = self.maskWidget.getSelectionMask()
-        self.assertFalse(numpy.all(numpy.equal(ref_mask, 0)))
+        ref_mask = maskWidget.getSelectionMask()
+        self.assertTrue(ref_mask.any())
 
         with temp_dir() as tmp:
             mask_filename = os.path.join(tmp, 'mask.' + file_format)
-            self.maskWidget.save(mask_filename, file_format)
+            maskWidget.save(mask_filename, file_format)
 
-            self.maskWidget.resetSelectionMask()
-            self.assertTrue(
-                numpy.all(numpy.equal(self.maskWidget.getSelectionMask(), 0)))
+            maskWidget.resetSelectionMask()
+            self.assertFalse(maskWidget.getSelectionMask().any())
 
-            self.maskWidget.load(mask_filename)
-            self.assertTrue(numpy.all(numpy.equal(
-                self.maskWidget.getSelectionMask(), ref_mask)))
+            maskWidget.load(mask_filename)
+            self.assertTrue(numpy.array_equal(
+                maskWidget.getSelectionMask(), ref_mask))
 
     def testLoadSaveNpy(self):
         self.__loadSave("npy")
@@ -269,23 +287,22 @@ class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
         self.__loadSave("csv")
 
     def testSigMaskChangedEmitted(self):
-        self.qapp.processEvents()
+        maskWidget = self.maskWidget
         self.plot.addScatter(
-                x=numpy.arange(1000),
-                y=1000 * (numpy.arange(1000) % 20),
+                x=_X1000,
+                y=_Y1000,
                 value=numpy.ones((1000,)),
                 legend='test')
         self.plot._setActiveItem(kind="scatter", legend="test")
         self.plot.resetZoom()
-        self.qapp.processEvents()
+        self._settle()
 
         self.plot.remove('test', kind='scatter')
-        self.qapp.processEvents()
 
         self.plot.addScatter(
-                x=numpy.arange(1000),
-                y=1000 * (numpy.arange(1000) % 20),
-                value=numpy.random.random(1000),
+                x=_X1000,
+                y=_Y1000,
+                value=_VALUES1000,
                 legend='test')
 
         l = []
@@ -293,14 +310,14 @@ class TestScatterMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
         def slot():
             l.append(1)
 
-        self.maskWidget.sigMaskChanged.connect(slot)
+        maskWidget.sigMaskChanged.connect(slot)
+        self.addCleanup(maskWidget.sigMaskChanged.disconnect, slot)
 
         # rectangle mask
-        toolButton = getQToolButtonFromAction(self.maskWidget.rectAction)
+        toolButton = self._getToolButton(maskWidget.rectAction)
         self.assertIsNot(toolButton, None)
         self.mouseClick(toolButton, qt.Qt.LeftButton)
-        self.maskWidget.maskStateGroup.button(1).click()
-        self.qapp.processEvents()
+        maskWidget.maskStateGroup.button(1).click()
         self._drag()
 
         self.assertGreater(len(l), 0)
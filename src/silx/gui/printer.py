@@ -32,12 +32,17 @@ __license__ = "MIT"
 __date__ = "01/03/2018"
 
 
+import threading
+
 from . import qt
 
 
 _printer = None
 """Shared QPrinter instance"""
 
+_printerLock = threading.Lock()
+"""Lock protecting the creation of the shared QPrinter"""
+
 
 def getDefaultPrinter():
     """Returns the default printer.
@@ -48,7 +53,9 @@ def getDefaultPrinter():
     """
     global _printer
     if _printer is None:
-        _printer = qt.QPrinter()
+        with _printerLock:
+            if _printer is None:
+                _printer = qt.QPrinter()
     return _printer
 
 
@@ -59,4 +66,5 @@ def setDefaultPrinter(printer):
     """
     assert isinstance(printer, qt.QPrinter)
     global _printer
-    _printer = printer
+    with _printerLock:
+        _printer = printer
@@ -35,6 +35,8 @@ The name of the loaded Qt binding is stored in the BINDING variable.
 This module provides a flat namespace over Qt bindings by importing
 all symbols from **QtCore**, **QtGui**, **QtWidgets** and **QtPrintSupport**
 packages and if available from **QtOpenGL** and **QtSvg** packages.
+With Python >= 3.7, **QtPrintSupport** is only imported when one of its
+symbols is first accessed.
 
 Example of using :mod:`silx.gui.qt` module:
 
@@ -46,5 +48,25 @@ For an alternative solution providing a structured namespace,
 see `qtpy <https://pypi.org/project/QtPy/>`_.
 """
 
+from . import _qt
 from ._qt import *  # noqa
 from ._utils import *  # noqa
+
+
+# Star import goes through __getattr__ for lazily imported symbols
+__all__ = sorted(set(name for name in globals() if not name.startswith('_'))
+                 .union(_qt._PRINT_SUPPORT_NAMES))
+
+
+def __getattr__(name):
+    # Forward lazily imported symbols (i.e., QtPrintSupport) of _qt (PEP 562)
+    if name in _qt._PRINT_SUPPORT_NAMES:
+        value = getattr(_qt, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()).union(_qt._PRINT_SUPPORT_NAMES))
@@ -29,6 +29,7 @@ __license__ = "MIT"
 __date__ = "23/05/2018"
 
 
+import importlib
 import logging
 import sys
 import traceback
@@ -83,7 +84,8 @@ if BINDING == 'PyQt5':
     from PyQt5.QtCore import *  # noqa
     from PyQt5.QtGui import *  # noqa
     from PyQt5.QtWidgets import *  # noqa
-    from PyQt5.QtPrintSupport import *  # noqa
+    if sys.version_info < (3, 7):
+        from PyQt5.QtPrintSupport import *  # noqa
 
     try:
         from PyQt5.QtOpenGL import *  # noqa
@@ -111,6 +113,8 @@ if BINDING == 'PyQt5':
 
     # Disable PyQt5's cooperative multi-inheritance since other bindings do not provide it.
     # See https://www.riverbankcomputing.com/static/Docs/PyQt5/multiinheritance.html?highlight=inheritance
+    # Having a non-sip class last in the MRO is what stops the cooperative
+    # __init__ chain: this cannot be done with __init_subclass__.
     class _Foo(object): pass
     class QObject(QObject, _Foo): pass
 
@@ -123,7 +127,8 @@ elif BINDING == 'PySide2':
     from PySide2.QtCore import *  # noqa
     from PySide2.QtGui import *  # noqa
     from PySide2.QtWidgets import *  # noqa
-    from PySide2.QtPrintSupport import *  # noqa
+    if sys.version_info < (3, 7):
+        from PySide2.QtPrintSupport import *  # noqa
 
     try:
         from PySide2.QtOpenGL import *  # noqa
@@ -150,6 +155,32 @@ else:
     raise ImportError('No Qt wrapper found. Install PyQt5, PySide2')
 
 
+_PRINT_SUPPORT_NAMES = (
+    'QAbstractPrintDialog', 'QPageSetupDialog', 'QPrintDialog',
+    'QPrintEngine', 'QPrintPreviewDialog', 'QPrintPreviewWidget',
+    'QPrinter', 'QPrinterInfo')
+"""Symbols provided by QtPrintSupport, listed to import it lazily"""
+
+
+def __getattr__(name):
+    """Import QtPrintSupport symbols on first access (PEP 562).
+
+    This avoids loading QtPrintSupport for applications not printing.
+    With Python < 3.7, QtPrintSupport is imported with the other modules.
+    """
+    if name in _PRINT_SUPPORT_NAMES:
+        module = importlib.import_module(BINDING + '.QtPrintSupport')
+        globals().update((key, value) for key, value in vars(module).items()
+                         if not key.startswith('_'))
+        return globals()[name]
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()).union(_PRINT_SUPPORT_NAMES))
+
+
 # provide a exception handler but not implement it by default
 def exceptionHandler(type_, value, trace):
     """
@@ -165,6 +196,12 @@ def exceptionHandler(type_, value, trace):
 
     """
     _logger.error("%s %s %s", type_, value, ''.join(traceback.format_tb(trace)))
+
+    app = QApplication.instance()
+    if (not isinstance(app, QApplication) or
+            app.platformName() in ('offscreen', 'minimal')):
+        return  # No way to display and close a modal dialog
+
     msg = QMessageBox()
     msg.setWindowTitle("Unhandled exception")
     msg.setIcon(QMessageBox.Critical)
@@ -29,7 +29,10 @@ __license__ = "MIT"
 __date__ = "05/12/2016"
 
 
+import importlib
 import os.path
+import subprocess
+import sys
 import unittest
 
 from silx.test.utils import temp_dir
@@ -42,6 +45,22 @@ except ImportError:
     qt_inspect = None
 
 
+def _runPython(script):
+    """Run a Python script in a subprocess and return its output
+
+    :param str script: The Python code to run
+    :rtype: str
+    """
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.abspath(p) for p in sys.path])
+    return subprocess.check_output(
+        [sys.executable, '-c', script],
+        env=env,
+        universal_newlines=True,
+        timeout=60)
+
+
 class TestQtWrapper(unittest.TestCase):
     """Minimalistic test to check that Qt has been loaded."""
 
@@ -50,6 +69,66 @@ class TestQtWrapper(unittest.TestCase):
         obj = qt.QObject()
         self.assertTrue(obj is not None)
 
+    def testQObjectNoCooperativeInit(self):
+        """Test that QObject does not call the __init__ of other bases."""
+        class Mixin(object):
+            def __init__(self):
+                raise AssertionError("Mixin.__init__ should not be called")
+
+        class Object(qt.QObject, Mixin):
+            pass
+
+        self.assertIsNotNone(Object())
+
+    def testFlatNamespace(self):
+        """Test that all symbols of the Qt modules are provided."""
+        for name in ('QtCore', 'QtGui', 'QtWidgets', 'QtPrintSupport'):
+            module = importlib.import_module(qt.BINDING + '.' + name)
+            for symbol in dir(module):
+                if not symbol.startswith('_'):
+                    with self.subTest(module=name, symbol=symbol):
+                        self.assertTrue(hasattr(qt, symbol))
+
+    def testStarImport(self):
+        """Test that star import provides the QtPrintSupport symbols."""
+        # Run in a new interpreter where QtPrintSupport is not yet loaded
+        output = _runPython(
+            "import importlib\n"
+            "namespace = {}\n"
+            "exec('from silx.gui.qt import *', namespace)\n"
+            "from silx.gui import qt\n"
+            "module = importlib.import_module(qt.BINDING + '.QtPrintSupport')\n"
+            "for symbol in dir(module):\n"
+            "    if not symbol.startswith('_'):\n"
+            "        print(symbol, symbol in namespace)\n")
+        lines = output.splitlines()
+        self.assertNotEqual(len(lines), 0)
+        for line in lines:
+            symbol, found = line.split()
+            with self.subTest(symbol=symbol):
+                self.assertEqual(found, 'True')
+
+    def _testExceptionHandler(self, createApp):
+        """Run exceptionHandler in a new interpreter and check it returns"""
+        output = _runPython(
+            "import sys\n"
+            "from silx.gui import qt\n"
+            "%s\n"
+            "try:\n"
+            "    raise RuntimeError('test')\n"
+            "except RuntimeError:\n"
+            "    qt.exceptionHandler(*sys.exc_info())\n"
+            "print('handled')\n" % createApp)
+        self.assertEqual(output.strip(), 'handled')
+
+    def testExceptionHandlerNoApplication(self):
+        """Test exceptionHandler without Qt application"""
+        self._testExceptionHandler("app = None")
+
+    def testExceptionHandlerCoreApplication(self):
+        """Test exceptionHandler with a QCoreApplication"""
+        self._testExceptionHandler("app = qt.QCoreApplication([])")
+
 
 class TestLoadUi(TestCaseQt):
     """Test loadUi function"""
@@ -33,6 +33,7 @@
 """
 from silx.gui import qt
 from silx.gui import icons
+from silx.gui.utils import blockSignals
 from silx.utils import deprecation
 
 __authors__ = ["V.A. Sole", "P. Knobel"]
@@ -40,6 +41,10 @@ __license__ = "MIT"
 __date__ = "16/01/2017"
 
 
+_digitsWidthCache = {}
+"""Width of a string of digits cached by (font key, DPI, number of digits)"""
+
+
 class FrameBrowser(qt.QWidget):
     """Frame browser widget, with 4 buttons/icons and a line edit to provide
     a way of selecting a frame index in a stack of images.
@@ -60,8 +65,8 @@ class FrameBrowser(qt.QWidget):
         qt.QWidget.__init__(self, parent)
 
         # Use the font size as the icon size to avoid to create bigger buttons
-        fontMetric = self.fontMetrics()
-        iconSize = qt.QSize(fontMetric.height(), fontMetric.height())
+        fontHeight = self.fontMetrics().height()
+        iconSize = qt.QSize(fontHeight, fontHeight)
 
         self.mainLayout = qt.QHBoxLayout(self)
         self.mainLayout.setContentsMargins(0, 0, 0, 0)
@@ -95,9 +100,11 @@ class FrameBrowser(qt.QWidget):
         else:
             first, last = 0, n
 
-        self._lineEdit.setFixedWidth(self._lineEdit.fontMetrics().boundingRect('%05d' % last).width())
         validator = qt.QIntValidator(first, last, self._lineEdit)
         self._lineEdit.setValidator(validator)
+        self._updateLineEditWidth()
+        # Fonts can be set on the line edit itself (e.g., with a style sheet)
+        self._lineEdit.installEventFilter(self)
         self._lineEdit.setText("%d" % first)
         self._label.setText("of %d" % last)
 
@@ -117,6 +124,23 @@ class FrameBrowser(qt.QWidget):
         """
         return self._lineEdit
 
+    def eventFilter(self, watched, event):
+        if watched is self._lineEdit and event.type() == qt.QEvent.FontChange:
+            self._updateLineEditWidth()
+        return super(FrameBrowser, self).eventFilter(watched, event)
+
+    def _updateLineEditWidth(self):
+        """Fit the line edit width to the number of digits of the range"""
+        bottom, top = self.getRange()
+        nDigits = max(5, len("%d" % bottom), len("%d" % top))
+        key = self._lineEdit.font().key(), self._lineEdit.logicalDpiX(), nDigits
+        width = _digitsWidthCache.get(key)
+        if width is None:
+            fontMetrics = self._lineEdit.fontMetrics()
+            width = fontMetrics.boundingRect("0" * nDigits).width()
+            _digitsWidthCache[key] = width
+        self._lineEdit.setFixedWidth(width)
+
     def limitWidget(self):
         """Returns the widget displaying axes limits.
 
@@ -143,19 +167,30 @@ class FrameBrowser(qt.QWidget):
     def _textChangedSlot(self):
         """Select frame number typed in the line edit widget"""
         txt = self._lineEdit.text()
+        current = "%d" % self._index
+        if txt == current:  # e.g., focus lost without editing
+            return
         if not len(txt):
-            self._lineEdit.setText("%d" % self._index)
+            self._lineEdit.setText(current)
             return
         new_value = int(txt)
-        if new_value == self._index:
-            return
+        if new_value != self._index:
+            self._setIndex(new_value)
+
+    def _setIndex(self, index):
+        """Update the current index and emit :attr:`sigIndexChanged`
+
+        The line edit text is expected to be already up-to-date.
+
+        :param int index: The new frame index
+        """
         ddict = {
             "event": "indexChanged",
             "old": self._index,
-            "new": new_value,
+            "new": index,
             "id": id(self)
         }
-        self._index = new_value
+        self._index = index
         self.sigIndexChanged.emit(ddict)
 
     def getRange(self):
@@ -178,6 +213,7 @@ class FrameBrowser(qt.QWidget):
         top = max(first, last)
         self._lineEdit.validator().setTop(top)
         self._lineEdit.validator().setBottom(bottom)
+        self._updateLineEditWidth()
         self.setValue(bottom)
 
         # Update limits
@@ -224,8 +260,11 @@ class FrameBrowser(qt.QWidget):
         elif value > top:
             value = top
 
-        self._lineEdit.setText("%d" % value)
-        self._textChangedSlot()
+        text = "%d" % value
+        if self._lineEdit.text() != text:
+            self._lineEdit.setText(text)
+        if value != self._index:
+            self._setIndex(value)
 
 
 class HorizontalSliderWithBrowser(qt.QAbstractSlider):
@@ -260,7 +299,7 @@ class HorizontalSliderWithBrowser(qt.QAbstractSlider):
         self.mainLayout.addWidget(self._slider, 1)
         self.mainLayout.addWidget(self._browser)
 
-        self._slider.valueChanged[int].connect(self._sliderSlot)
+        self._slider.valueChanged.connect(self._sliderSlot)
         self._browser.sigIndexChanged.connect(self._browserSlot)
 
     def lineEdit(self):
@@ -305,12 +344,16 @@ class HorizontalSliderWithBrowser(qt.QAbstractSlider):
     def _sliderSlot(self, value):
         """Emit selected value when slider is activated
         """
-        self._browser.setValue(value)
+        with blockSignals(self._browser):
+            self._browser.setValue(value)
         self.valueChanged.emit(value)
 
     def _browserSlot(self, ddict):
         """Emit selected value when browser state is changed"""
-        self._slider.setValue(ddict['new'])
+        value = ddict['new']
+        with blockSignals(self._slider):
+            self._slider.setValue(value)
+        self.valueChanged.emit(value)
 
     def setValue(self, value):
         """Set value
@@ -29,8 +29,10 @@ __date__ = "23/03/2018"
 
 import unittest
 
-from silx.gui.utils.testutils import TestCaseQt
+from silx.gui import qt
+from silx.gui.utils.testutils import TestCaseQt, SignalListener
 from silx.gui.widgets.FrameBrowser import FrameBrowser
+from silx.gui.widgets.FrameBrowser import HorizontalSliderWithBrowser
 
 
 class TestFrameBrowser(TestCaseQt):
@@ -61,11 +63,72 @@ class TestFrameBrowser(TestCaseQt):
         widget.setValue(range_[0] - 100)
         self.assertEqual(widget.getValue(), range_[0])
 
+        listener = SignalListener()
+        widget.sigIndexChanged.connect(listener)
+        widget.setValue(range_[0])
+        self.assertEqual(listener.callCount(), 0)
+        widget.setValue(10)
+        self.assertEqual(listener.callCount(), 1)
+        self.assertEqual(widget.lineEdit().text(), "10")
+
+    def testLineEditWidth(self):
+        """Test that the line edit width follows the range"""
+        widget = FrameBrowser()
+        widget.setRange(0, 10)
+        width = widget.lineEdit().width()
+        widget.setRange(0, 10 ** 9)
+        self.assertGreater(widget.lineEdit().width(), width)
+
+    def testLineEditWidthFontChange(self):
+        """Test that the line edit width follows its font"""
+        for setFont in ('widget', 'lineEdit', 'styleSheet'):
+            with self.subTest(setFont=setFont):
+                widget = FrameBrowser()
+                widget.setAttribute(qt.Qt.WA_DeleteOnClose)
+                widget.show()
+                self.qWaitForWindowExposed(widget)
+                width = widget.lineEdit().width()
+
+                font = qt.QFont(widget.lineEdit().font())
+                font.setPointSize(60)
+                if setFont == 'widget':
+                    widget.setFont(font)
+                elif setFont == 'lineEdit':
+                    widget.lineEdit().setFont(font)
+                else:
+                    widget.setStyleSheet("QLineEdit {font-size: 60pt;}")
+                self.qapp.processEvents()
+                self.assertGreater(widget.lineEdit().width(), width)
+                widget.close()
+
+
+class TestHorizontalSliderWithBrowser(TestCaseQt):
+    """Test for HorizontalSliderWithBrowser"""
+
+    def test(self):
+        """Test value synchronization of slider and browser"""
+        widget = HorizontalSliderWithBrowser()
+        widget.setRange(0, 20)
+        listener = SignalListener()
+        widget.valueChanged.connect(listener)
+
+        widget.setValue(5)
+        self.assertEqual(widget.value(), 5)
+        self.assertEqual(widget.lineEdit().text(), "5")
+        self.assertEqual(listener.arguments(), [(5,)])
+
+        listener.clear()
+        widget.lineEdit().setText("12")
+        widget.lineEdit().editingFinished.emit()
+        self.assertEqual(widget.value(), 12)
+        self.assertEqual(listener.arguments(), [(12,)])
+
 
 def suite():
     loader = unittest.defaultTestLoader.loadTestsFromTestCase
     test_suite = unittest.TestSuite()
     test_suite.addTest(loader(TestFrameBrowser))
+    test_suite.addTest(loader(TestHorizontalSliderWithBrowser))
     return test_suite
 
 
@@ -56,7 +56,11 @@ def get_attr_as_string(*args, **kwargs):
     return get_attr_as_unicode(*args, **kwargs)
 
 
-def get_attr_as_unicode(item, attr_name, default=None):
+_MISSING = object()
+"""Sentinel for attributes not found in get_attr_as_unicode cache"""
+
+
+def get_attr_as_unicode(item, attr_name, default=None, cache=None):
     """Return item.attrs[attr_name] as unicode or as a
     list of unicode.
 
@@ -66,64 +70,105 @@ def get_attr_as_unicode(item, attr_name, default=None):
     :param item: Group or dataset
     :param attr_name: Attribute name
     :param default: Value to be returned if attribute is not found.
+    :param Union[dict,None] cache:
+        Optional dict storing attributes read during a validation pass,
+        so that each attribute of an item is read only once.
+        It is keyed by file name, item name and attribute name.
     :return: item.attrs[attr_name]
     """
-    attr = item.attrs.get(attr_name, default)
+    if cache is None:
+        attr = item.attrs.get(attr_name, default)
+    else:
+        # Only read the requested attribute: others might be large or
+        # not readable. Missing attributes are cached too.
+        key = _cache_key(item), attr_name
+        if key in cache:
+            attr = cache[key]
+        else:
+            attr = item.attrs.get(attr_name, _MISSING)
+            cache[key] = attr
+        if attr is _MISSING:
+            attr = default
 
     if isinstance(attr, bytes):
         # byte-string
         return attr.decode("utf-8")
     elif isinstance(attr, numpy.ndarray) and not attr.shape:
-        if isinstance(attr[()], bytes):
+        value = attr[()]
+        if isinstance(value, bytes):
             # byte string as ndarray scalar
-            return attr[()].decode("utf-8")
+            return value.decode("utf-8")
         else:
             # other scalar, possibly unicode
-            return attr[()]
+            return value
     elif isinstance(attr, numpy.ndarray) and len(attr.shape):
-        if hasattr(attr[0], "decode"):
-            # array of byte-strings
-            return [element.decode("utf-8") for element in attr]
+        kind = attr.dtype.kind
+        if kind == "S":
+            # array of fixed-length byte-strings
+            return numpy.char.decode(attr, "utf-8").tolist()
+        elif kind == "O":
+            # array of variable-length strings, either bytes or unicode
+            return [element.decode("utf-8") if isinstance(element, bytes) else element
+                    for element in attr.tolist()]
         else:
-            # other array, most likely unicode objects
-            return [element for element in attr]
+            # other array, most likely unicode
+            return attr.tolist()
+    elif attr is None or isinstance(attr, (str, int, float, numpy.generic)):
+        # immutable scalar
+        return attr
     else:
         return copy.deepcopy(attr)
 
 
-def get_uncertainties_names(group, signal_name):
+def _cache_key(item):
+    """Returns the key identifying an item in get_attr_as_unicode cache.
+
+    The file name is part of the key since external links
+    can lead to items of other files.
+
+    :param item: Group or dataset
+    :rtype: tuple
+    """
+    h5file = item.file
+    filename = None if h5file is None else h5file.filename
+    return filename, item.name
+
+
+def get_uncertainties_names(group, signal_name, cache=None):
     # Test consistency of @uncertainties
-    uncertainties_names = get_attr_as_unicode(group, "uncertainties")
+    uncertainties_names = get_attr_as_unicode(group, "uncertainties", cache=cache)
     if uncertainties_names is None:
-        uncertainties_names = get_attr_as_unicode(group[signal_name], "uncertainties")
+        uncertainties_names = get_attr_as_unicode(
+            group[signal_name], "uncertainties", cache=cache)
     if isinstance(uncertainties_names, str):
         uncertainties_names = [uncertainties_names]
     return uncertainties_names
 
 
-def get_signal_name(group):
+def get_signal_name(group, cache=None):
     """Return the name of the (main) signal in a NXdata group.
     Return None if this info is missing (invalid NXdata).
 
     """
-    signal_name = get_attr_as_unicode(group, "signal", default=None)
+    signal_name = get_attr_as_unicode(group, "signal", default=None, cache=cache)
     if signal_name is None:
         nxdata_logger.info("NXdata group %s does not define a signal attr. "
                            "Testing legacy specification.", group.name)
         for key in group:
-            if "signal" in group[key].attrs:
-                signal_name = key
-                signal_attr = group[key].attrs["signal"]
-                if signal_attr in [1, b"1", u"1"]:
-                    # This is the main (default) signal
-                    break
+            signal_attr = group[key].attrs.get("signal")
+            if signal_attr is None:
+                continue
+            signal_name = key
+            if signal_attr in [1, b"1", u"1"]:
+                # This is the main (default) signal
+                return signal_name
     return signal_name
 
 
-def get_auxiliary_signals_names(group):
+def get_auxiliary_signals_names(group, cache=None):
     """Return list of auxiliary signals names"""
     auxiliary_signals_names = get_attr_as_unicode(group, "auxiliary_signals",
-                                                  default=[])
+                                                  default=[], cache=cache)
     if isinstance(auxiliary_signals_names, (str, bytes)):
         auxiliary_signals_names = [auxiliary_signals_names]
     return auxiliary_signals_names
@@ -132,52 +177,59 @@ def get_auxiliary_signals_names(group):
 def validate_auxiliary_signals(group, signal_name, auxiliary_signals_names):
     """Check data dimensionality and size. Return False if invalid."""
     issues = []
+    signal_shape = group[signal_name].shape
     for asn in auxiliary_signals_names:
-        if asn not in group or not is_dataset(group[asn]):
+        auxiliary_signal = group.get(asn)
+        if auxiliary_signal is None or not is_dataset(auxiliary_signal):
             issues.append(
                 "Cannot find auxiliary signal dataset '%s'" % asn)
-        elif group[signal_name].shape != group[asn].shape:
-            issues.append("Auxiliary signal dataset '%s' does not" % asn +
-                           " have the same shape as the main signal.")
+        elif signal_shape != auxiliary_signal.shape:
+            issues.append("Auxiliary signal dataset '%s' does not have "
+                          "the same shape as the main signal." % asn)
     return issues
 
 
-def validate_number_of_axes(group, signal_name, num_axes):
+def validate_number_of_axes(group, signal_name, num_axes, cache=None):
     issues = []
-    ndims = len(group[signal_name].shape)
+    signal = group[signal_name]
+    signal_shape = signal.shape
+    ndims = len(signal_shape)
     if 1 < ndims < num_axes:
         # ndim = 1 with several axes could be a scatter
         issues.append(
-            "More @axes defined than there are " +
-            "signal dimensions: " +
+            "More @axes defined than there are signal dimensions: "
             "%d axes, %d dimensions." % (num_axes, ndims))
 
     # case of less axes than dimensions: number of axes must match
     # dimensionality defined by @interpretation
     elif ndims > num_axes:
-        interpretation = get_attr_as_unicode(group[signal_name], "interpretation")
+        interpretation = get_attr_as_unicode(
+            signal, "interpretation", cache=cache)
         if interpretation is None:
-            interpretation = get_attr_as_unicode(group, "interpretation")
+            interpretation = get_attr_as_unicode(
+                group, "interpretation", cache=cache)
         if interpretation is None:
-            issues.append("No @interpretation and not enough" +
-                          " @axes defined.")
+            issues.append("No @interpretation and not enough @axes defined.")
+            return issues
 
-        elif interpretation not in INTERPDIM:
-            issues.append("Unrecognized @interpretation=" + interpretation +
-                          " for data with wrong number of defined @axes.")
+        interpretation_ndims = INTERPDIM.get(interpretation)
+        if interpretation_ndims is None:
+            issues.append("Unrecognized @interpretation=%s for data with "
+                          "wrong number of defined @axes." % interpretation)
         elif interpretation == "rgba-image":
-            if ndims != 3 or group[signal_name].shape[-1] not in [3, 4]:
+            if ndims != 3 or signal_shape[-1] not in [3, 4]:
                 issues.append(
-                    "Inconsistent RGBA Image. Expected 3 dimensions with " +
-                    "last one of length 3 or 4. Got ndim=%d " % ndims +
-                    "with last dimension of length %d." % group[signal_name].shape[-1])
+                    "Inconsistent RGBA Image. Expected 3 dimensions with "
+                    "last one of length 3 or 4. Got ndim=%d "
+                    "with last dimension of length %d." % (ndims, signal_shape[-1]))
             if num_axes != 2:
                 issues.append(
                     "Inconsistent number of axes for RGBA Image. Expected "
                     "3, but got %d." % ndims)
 
-        elif num_axes != INTERPDIM[interpretation]:
+        elif num_axes != interpretation_ndims:
             issues.append(
-                "%d-D signal with @interpretation=%s " % (ndims, interpretation) +
-                "must define %d or %d axes." % (ndims, INTERPDIM[interpretation]))
+                "%d-D signal with @interpretation=%s "
+                "must define %d or %d axes." % (
+                    ndims, interpretation, ndims, interpretation_ndims))
     return issues
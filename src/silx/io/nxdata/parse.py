@@ -224,36 +224,42 @@ class NXdata(object):
         """Fill :attr:`issues` with error messages for each error found."""
         if not is_group(self.group):
             raise TypeError("group must be a h5py-like group")
-        if get_attr_as_unicode(self.group, "NX_class") != "NXdata":
+        # Attributes read during this validation pass
+        cache = {}
+        if get_attr_as_unicode(self.group, "NX_class", cache=cache) != "NXdata":
             self.issues.append("Group has no attribute @NX_class='NXdata'")
             return
 
-        signal_name = get_signal_name(self.group)
+        signal_name = get_signal_name(self.group, cache=cache)
         if signal_name is None:
             self.issues.append("No @signal attribute on the NXdata group, "
                                "and no dataset with a @signal=1 attr found")
             # very difficult to do more consistency tests without signal
             return
 
-        elif signal_name not in self.group or not is_dataset(self.group[signal_name]):
+        signal = self.group.get(signal_name)
+        if signal is None or not is_dataset(signal):
             self.issues.append("Cannot find signal dataset '%s'" % signal_name)
             return
 
-        auxiliary_signals_names = get_auxiliary_signals_names(self.group)
+        auxiliary_signals_names = get_auxiliary_signals_names(
+            self.group, cache=cache)
         self.issues += validate_auxiliary_signals(self.group,
                                                   signal_name,
                                                   auxiliary_signals_names)
 
         if "axes" in self.group.attrs:
-            axes_names = get_attr_as_unicode(self.group, "axes")
+            axes_names = get_attr_as_unicode(self.group, "axes", cache=cache)
             if isinstance(axes_names, (str, bytes)):
                 axes_names = [axes_names]
 
             self.issues += validate_number_of_axes(self.group, signal_name,
-                                                   num_axes=len(axes_names))
+                                                   num_axes=len(axes_names),
+                                                   cache=cache)
 
             # Test consistency of @uncertainties
-            uncertainties_names = get_uncertainties_names(self.group, signal_name)
+            uncertainties_names = get_uncertainties_names(
+                self.group, signal_name, cache=cache)
             if uncertainties_names is not None:
                 if len(uncertainties_names) != len(axes_names):
                     if len(uncertainties_names) < len(axes_names):
@@ -268,7 +274,7 @@ class NXdata(object):
             # Test individual axes
             is_scatter = True  # true if all axes have the same size as the signal
             signal_size = 1
-            for dim in self.group[signal_name].shape:
+            for dim in signal.shape:
                 signal_size *= dim
             polynomial_axes_names = []
             for i, axis_name in enumerate(axes_names):
@@ -294,7 +300,7 @@ class NXdata(object):
                     axis_len = lg_idx + 1 - fg_idx
 
                 if axis_len != signal_size:
-                    if axis_len not in self.group[signal_name].shape + (1, 2):
+                    if axis_len not in signal.shape + (1, 2):
                         self.issues.append(
                                 "Axis %s number of elements does not " % axis_name +
                                 "correspond to the length of any signal dimension,"
@@ -332,7 +338,7 @@ class NXdata(object):
         else:
             errors = None
         if errors:
-            if self.group[errors].shape != self.group[signal_name].shape:
+            if self.group[errors].shape != signal.shape:
                 # In principle just the same size should be enough but
                 # NeXus documentation imposes to have the same shape
                 self.issues.append(
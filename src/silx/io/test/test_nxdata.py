@@ -28,6 +28,8 @@ __license__ = "MIT"
 __date__ = "24/03/2020"
 
 
+import os
+import shutil
 import tempfile
 import unittest
 import h5py
@@ -563,6 +565,128 @@ class TestSaveNXdata(unittest.TestCase):
         h5f.close()
 
 
+class TestGetAttrAsUnicode(unittest.TestCase):
+    """Test nxdata.get_attr_as_unicode"""
+
+    def setUp(self):
+        self.h5f = h5py.File("get_attr_as_unicode.h5", "w", driver="core",
+                             backing_store=False)
+
+    def tearDown(self):
+        self.h5f.close()
+
+    def testBytesArray(self):
+        self.h5f.attrs["attr"] = numpy.array([b"a", u"\u00e9".encode("utf-8")])
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"),
+                         [u"a", u"\u00e9"])
+
+    def testBytesScalar(self):
+        self.h5f.attrs["attr"] = numpy.array(b"abc")
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"), u"abc")
+
+    def testUnicodeArray(self):
+        self.h5f.attrs.create("attr", data=[u"a", u"bc"], dtype=text_dtype)
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"),
+                         [u"a", u"bc"])
+
+    def testObjectBytesArray(self):
+        self.h5f.attrs.create("attr", data=[b"a", b"bc"],
+                              dtype=h5py.special_dtype(vlen=bytes))
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"),
+                         [u"a", u"bc"])
+
+    def testEmptyArray(self):
+        self.h5f.attrs["attr"] = numpy.array([], dtype="S1")
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"), [])
+
+    def testScalar(self):
+        self.h5f.attrs["attr"] = 3
+        self.assertEqual(nxdata.get_attr_as_unicode(self.h5f, "attr"), 3)
+
+    def testDefaultIsCopied(self):
+        default = ["a"]
+        result = nxdata.get_attr_as_unicode(self.h5f, "attr", default=default)
+        self.assertEqual(result, default)
+        self.assertIsNot(result, default)
+
+    def testDefault(self):
+        self.assertIsNone(nxdata.get_attr_as_unicode(self.h5f, "attr"))
+        self.assertEqual(
+            nxdata.get_attr_as_unicode(self.h5f, "attr", default="d"), "d")
+
+    def testCache(self):
+        cache = {}
+        self.h5f.attrs["attr"] = b"abc"
+        self.assertEqual(
+            nxdata.get_attr_as_unicode(self.h5f, "attr", cache=cache), u"abc")
+        self.assertIsNone(
+            nxdata.get_attr_as_unicode(self.h5f, "missing", cache=cache))
+
+        # Cached values are used
+        del self.h5f.attrs["attr"]
+        self.h5f.attrs["missing"] = b"def"
+        self.assertEqual(
+            nxdata.get_attr_as_unicode(self.h5f, "attr", cache=cache), u"abc")
+        self.assertEqual(
+            nxdata.get_attr_as_unicode(self.h5f, "missing", "d", cache=cache),
+            "d")
+
+
+class TestNXdataExternalLink(unittest.TestCase):
+    """Test NXdata validation with a signal in an external file"""
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        ext_fname = os.path.join(self.tempdir, "ext.h5")
+        with h5py.File(ext_fname, "w") as h5f:
+            # Same path as the NXdata group in the main file
+            signal = h5f.create_dataset("/entry/data",
+                                        data=numpy.zeros((2, 3, 4)))
+            signal.attrs["interpretation"] = "image"
+
+        self.h5f = h5py.File(os.path.join(self.tempdir, "main.h5"), "w")
+        g = self.h5f.create_group("/entry/data")
+        g.attrs["NX_class"] = "NXdata"
+        g.attrs["signal"] = "data"
+        g.attrs["axes"] = numpy.array([b"y", b"x"])
+        g["data"] = h5py.ExternalLink(ext_fname, "/entry/data")
+        g.create_dataset("y", data=numpy.arange(3))
+        g.create_dataset("x", data=numpy.arange(4))
+
+    def tearDown(self):
+        self.h5f.close()
+        shutil.rmtree(self.tempdir)
+
+    def testValidity(self):
+        nxd = nxdata.NXdata(self.h5f["/entry/data"])
+        self.assertTrue(nxd.is_valid, nxd.issues)
+        self.assertEqual(nxd.interpretation, "image")
+
+
+class TestNXdataUnreadableAttribute(unittest.TestCase):
+    """Test NXdata validation with an attribute h5py cannot read"""
+
+    def setUp(self):
+        self.h5f = h5py.File("unreadable_attribute.h5", "w", driver="core",
+                             backing_store=False)
+        g = self.h5f.create_group("data")
+        g.attrs["NX_class"] = "NXdata"
+        g.attrs["signal"] = "signal"
+        g.create_dataset("signal", data=numpy.arange(10))
+        # HDF5 time type has no numpy equivalent
+        h5py.h5a.create(g.id, b"odd", h5py.h5t.UNIX_D32LE,
+                        h5py.h5s.create(h5py.h5s.SCALAR))
+
+    def tearDown(self):
+        self.h5f.close()
+
+    def testValidity(self):
+        group = self.h5f["data"]
+        self.assertTrue(nxdata.is_valid_nxdata(group))
+        nxd = nxdata.NXdata(group)
+        self.assertTrue(nxd.is_valid, nxd.issues)
+
+
 def suite():
     test_suite = unittest.TestSuite()
     test_suite.addTest(
@@ -571,6 +695,12 @@ def suite():
         unittest.defaultTestLoader.loadTestsFromTestCase(TestLegacyNXdata))
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestSaveNXdata))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestGetAttrAsUnicode))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestNXdataExternalLink))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestNXdataUnreadableAttribute))
     return test_suite
 
 
@@ -29,6 +29,7 @@ __license__ = "MIT"
 __date__ = "09/01/2017"
 
 import h5py
+import itertools
 import numpy
 import os
 import tempfile
@@ -37,122 +38,141 @@ import unittest
 from ..array_like import DatasetView, ListOfImages
 from ..array_like import get_dtype, get_concatenated_dtype, get_shape,\
     is_array, is_nested_sequence, is_list_of_arrays
+from ..testutils import ParametricTestCase
 
 
-class TestTransposedDatasetView(unittest.TestCase):
+_VOLUME = numpy.arange(5 * 10 * 20).reshape(5, 10, 20)
+"""3D array used as reference data"""
+_VOLUME.flags.writeable = False  # Shared by all tests
 
-    def setUp(self):
-        # dataset attributes
-        self.ndim = 3
-        self.original_shape = (5, 10, 20)
-        self.size = 1
-        for dim in self.original_shape:
-            self.size *= dim
+_ALL_PERMUTATIONS = tuple(itertools.permutations((0, 1, 2)))
+"""All transpositions of a 3D array"""
+
+_REVERSED_TRANSPOSITION = (2, 1, 0)
+"""Transposition reversing the dimensions of a 3D array"""
+
+_SLICING_SELECTIONS = (
+    (2, slice(None), slice(None)),
+    (slice(None), 1, slice(0, 8)),
+    (slice(0, 3), slice(None), 3),
+    (1, 3, slice(None)),
+    (slice(None), 2, 1),
+    (4, slice(1, 9, 2), 2))
+"""Selections used to test slicing of transposed 3D views"""
+
+_INT_DTYPE = numpy.dtype(int)
+_FLOAT_DTYPE = numpy.dtype(float)
+
+
+def _sample_indices(size, count=4):
+    """Returns up to count indices evenly spread over [0, size-1].
 
-        self.volume = numpy.arange(self.size).reshape(self.original_shape)
+    The first and last indices are always included.
 
-        self.tempdir = tempfile.mkdtemp()
-        self.h5_fname = os.path.join(self.tempdir, "tempfile.h5")
-        with h5py.File(self.h5_fname, "w") as f:
-            f["volume"] = self.volume
+    :param int size: Length of the dimension to sample
+    :param int count: Number of indices to sample
+    :rtype: List[int]
+    """
+    # Python int: views do not handle numpy integers as scalar indices
+    return numpy.unique(numpy.linspace(0, size - 1, count).astype(int)).tolist()
 
-        self.h5f = h5py.File(self.h5_fname, "r")
 
-        self.all_permutations = [(0, 1, 2), (0, 2, 1), (1, 0, 2), (1, 2, 0),
-                                 (2, 0, 1), (2, 1, 0)]
+class _TestTransposedArrayLike(object):
+    """Tests common to the array-like views of a 3D volume.
 
-    def tearDown(self):
-        self.h5f.close()
-        os.unlink(self.h5_fname)
-        os.rmdir(self.tempdir)
+    Subclasses must implement :meth:`_createView`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(_TestTransposedArrayLike, cls).setUpClass()
+        cls.volume = _VOLUME
+        cls.ndim = _VOLUME.ndim
+        cls.original_shape = _VOLUME.shape
+        cls.size = _VOLUME.size
+
+        # Reference transposed volumes (views of cls.volume)
+        cls.transposed_volumes = dict(
+            (transposition, cls.volume.transpose(transposition))
+            for transposition in _ALL_PERMUTATIONS)
+
+    def _createView(self, transposition=None):
+        """Returns the tested array-like view of :attr:`volume`
+
+        :param Union[tuple,None] transposition:
+            List of dimensions (0... n-1) sorted in the desired order
+        """
+        raise NotImplementedError()
 
     def _testSize(self, obj):
         """These assertions apply to all following test cases"""
         self.assertEqual(obj.ndim, self.ndim)
         self.assertEqual(obj.size, self.size)
-        size_from_shape = 1
-        for dim in obj.shape:
-            size_from_shape *= dim
-        self.assertEqual(size_from_shape, self.size)
+        self.assertEqual(numpy.prod(obj.shape), self.size)
 
         for dim in self.original_shape:
             self.assertIn(dim, obj.shape)
 
     def testNoTransposition(self):
         """no transposition (transposition = (0, 1, 2))"""
-        a = DatasetView(self.h5f["volume"])
+        a = self._createView()
 
         self.assertEqual(a.shape, self.original_shape)
         self._testSize(a)
 
+        a_as_array = numpy.asarray(a)
+        numpy.testing.assert_array_equal(a_as_array, self.volume)
+
         # reversing the dimensions twice results in no change
-        rtrans = list(reversed(range(self.ndim)))
-        self.assertTrue(numpy.array_equal(
-                a,
-                a.transpose(rtrans).transpose(rtrans)))
+        rtrans = _REVERSED_TRANSPOSITION
+        numpy.testing.assert_array_equal(
+            a_as_array,
+            a.transpose(rtrans).transpose(rtrans))
 
-        for i in range(a.shape[0]):
-            for j in range(a.shape[1]):
-                for k in range(a.shape[2]):
-                    self.assertEqual(self.h5f["volume"][i, j, k],
-                                     a[i, j, k])
+        # test .T property
+        numpy.testing.assert_array_equal(a.T, a.transpose(rtrans))
 
     def _testTransposition(self, transposition):
-        """test transposed dataset
+        """test transposed view
 
         :param tuple transposition: List of dimensions (0... n-1) sorted
             in the desired order
         """
-        a = DatasetView(self.h5f["volume"],
-                        transposition=transposition)
+        a = self._createView(transposition)
         self._testSize(a)
 
-        # sort shape of transposed object, to hopefully find the original shape
-        sorted_shape = tuple(dim_size for (_, dim_size) in
-                             sorted(zip(transposition, a.shape)))
+        # apply inverse transposition to shape, to find the original shape
+        sorted_shape = tuple(a.shape[dim] for dim in numpy.argsort(transposition))
         self.assertEqual(sorted_shape, self.original_shape)
 
-        a_as_array = numpy.array(self.h5f["volume"]).transpose(transposition)
+        a_as_array = self.transposed_volumes[transposition]
 
         # test the __array__ method
-        self.assertTrue(numpy.array_equal(
-                numpy.array(a),
-                a_as_array))
+        numpy.testing.assert_array_equal(numpy.asarray(a), a_as_array)
 
         # test slicing
-        for selection in [(2, slice(None), slice(None)),
-                          (slice(None), 1, slice(0, 8)),
-                          (slice(0, 3), slice(None), 3),
-                          (1, 3, slice(None)),
-                          (slice(None), 2, 1),
-                          (4, slice(1, 9, 2), 2)]:
-            self.assertIsInstance(a[selection], numpy.ndarray)
-            self.assertTrue(numpy.array_equal(
+        for selection in _SLICING_SELECTIONS:
+            with self.subTest(selection=selection):
+                self.assertIsInstance(a[selection], numpy.ndarray)
+                numpy.testing.assert_array_equal(
                     a[selection],
-                    a_as_array[selection]))
-
-        # test the DatasetView.__getitem__ for single values
-        # (step adjusted to test at least 3 indices in each dimension)
-        for i in range(0, a.shape[0], a.shape[0] // 3):
-            for j in range(0, a.shape[1], a.shape[1] // 3):
-                for k in range(0, a.shape[2], a.shape[2] // 3):
-                    sorted_indices = tuple(idx for (_, idx) in
-                                           sorted(zip(transposition, [i, j, k])))
-                    viewed_value = a[i, j, k]
-                    corresponding_original_value = self.h5f["volume"][sorted_indices]
-                    self.assertEqual(viewed_value,
-                                     corresponding_original_value)
+                    a_as_array[selection])
+
+        # test the __getitem__ for single values
+        indices = [_sample_indices(dim) for dim in a.shape]
+        viewed_values = [a[i, j, k] for i, j, k in itertools.product(*indices)]
+        numpy.testing.assert_array_equal(
+            viewed_values,
+            a_as_array[numpy.ix_(*indices)].ravel())
 
         # reversing the dimensions twice results in no change
-        rtrans = list(reversed(range(self.ndim)))
-        self.assertTrue(numpy.array_equal(
-                a,
-                a.transpose(rtrans).transpose(rtrans)))
+        rtrans = _REVERSED_TRANSPOSITION
+        numpy.testing.assert_array_equal(
+            a_as_array,
+            a.transpose(rtrans).transpose(rtrans))
 
         # test .T property
-        self.assertTrue(numpy.array_equal(
-                a.T,
-                a.transpose(rtrans)))
+        numpy.testing.assert_array_equal(a.T, a_as_array.T)
 
     def testTransposition012(self):
         """transposition = (0, 1, 2)
@@ -180,193 +200,64 @@ class TestTransposedDatasetView(unittest.TestCase):
         self._testTransposition((2, 1, 0))
 
     def testAllDoubleTranspositions(self):
-        for trans1 in self.all_permutations:
-            for trans2 in self.all_permutations:
-                self._testDoubleTransposition(trans1, trans2)
+        for trans1 in _ALL_PERMUTATIONS:
+            for trans2 in _ALL_PERMUTATIONS:
+                with self.subTest(transposition1=trans1, transposition2=trans2):
+                    self._testDoubleTransposition(trans1, trans2)
 
     def _testDoubleTransposition(self, transposition1, transposition2):
-        a = DatasetView(self.h5f["volume"],
-                        transposition=transposition1).transpose(transposition2)
+        a = self._createView(transposition1).transpose(transposition2)
 
-        b = self.volume.transpose(transposition1).transpose(transposition2)
+        b = self.transposed_volumes[transposition1].transpose(transposition2)
 
-        self.assertTrue(numpy.array_equal(a, b),
-                        "failed with double transposition %s %s" % (transposition1, transposition2))
+        numpy.testing.assert_array_equal(
+            a, b,
+            err_msg="failed with double transposition %s %s" % (transposition1, transposition2))
 
     def test1DIndex(self):
-        a = DatasetView(self.h5f["volume"])
-        self.assertTrue(numpy.array_equal(self.volume[1],
-                                          a[1]))
+        a = self._createView()
+        numpy.testing.assert_array_equal(self.volume[1], a[1])
 
-        b = DatasetView(self.h5f["volume"], transposition=(1, 0, 2))
-        self.assertTrue(numpy.array_equal(self.volume[:, 1, :],
-                                          b[1]))
+        b = self._createView(transposition=(1, 0, 2))
+        numpy.testing.assert_array_equal(self.volume[:, 1, :], b[1])
 
 
-class TestTransposedListOfImages(unittest.TestCase):
-    def setUp(self):
-        # images attributes
-        self.ndim = 3
-        self.original_shape = (5, 10, 20)
-        self.size = 1
-        for dim in self.original_shape:
-            self.size *= dim
+class TestTransposedDatasetView(_TestTransposedArrayLike, ParametricTestCase):
 
-        volume = numpy.arange(self.size).reshape(self.original_shape)
+    @classmethod
+    def setUpClass(cls):
+        super(TestTransposedDatasetView, cls).setUpClass()
 
-        self.images = []
-        for i in range(self.original_shape[0]):
-            self.images.append(
-                    volume[i])
+        # The file is only read by the tests: share it between them
+        cls.tempdir = tempfile.mkdtemp()
+        cls.h5_fname = os.path.join(cls.tempdir, "tempfile.h5")
+        with h5py.File(cls.h5_fname, "w") as f:
+            # Contiguous dataset: no chunk cache nor filter on reading
+            f.create_dataset("volume", data=cls.volume, chunks=None)
 
-        self.images_as_3D_array = numpy.array(self.images)
+        cls.h5f = h5py.File(cls.h5_fname, "r")
 
-        self.all_permutations = [(0, 1, 2), (0, 2, 1), (1, 0, 2), (1, 2, 0),
-                                 (2, 0, 1), (2, 1, 0)]
+    @classmethod
+    def tearDownClass(cls):
+        cls.h5f.close()
+        os.unlink(cls.h5_fname)
+        os.rmdir(cls.tempdir)
+        super(TestTransposedDatasetView, cls).tearDownClass()
 
-    def tearDown(self):
-        pass
+    def _createView(self, transposition=None):
+        return DatasetView(self.h5f["volume"], transposition=transposition)
 
-    def _testSize(self, obj):
-        """These assertions apply to all following test cases"""
-        self.assertEqual(obj.ndim, self.ndim)
-        self.assertEqual(obj.size, self.size)
-        size_from_shape = 1
-        for dim in obj.shape:
-            size_from_shape *= dim
-        self.assertEqual(size_from_shape, self.size)
 
-        for dim in self.original_shape:
-            self.assertIn(dim, obj.shape)
-
-    def testNoTransposition(self):
-        """no transposition (transposition = (0, 1, 2))"""
-        a = ListOfImages(self.images)
-
-        self.assertEqual(a.shape, self.original_shape)
-        self._testSize(a)
-
-        for i in range(a.shape[0]):
-            for j in range(a.shape[1]):
-                for k in range(a.shape[2]):
-                    self.assertEqual(self.images[i][j, k],
-                                     a[i, j, k])
-
-        # reversing the dimensions twice results in no change
-        rtrans = list(reversed(range(self.ndim)))
-        self.assertTrue(numpy.array_equal(
-                a,
-                a.transpose(rtrans).transpose(rtrans)))
-
-        # test .T property
-        self.assertTrue(numpy.array_equal(
-                a.T,
-                a.transpose(rtrans)))
-
-    def _testTransposition(self, transposition):
-        """test transposed dataset
-
-        :param tuple transposition: List of dimensions (0... n-1) sorted
-            in the desired order
-        """
-        a = ListOfImages(self.images,
-                         transposition=transposition)
-        self._testSize(a)
-
-        # sort shape of transposed object, to hopefully find the original shape
-        sorted_shape = tuple(dim_size for (_, dim_size) in
-                             sorted(zip(transposition, a.shape)))
-        self.assertEqual(sorted_shape, self.original_shape)
+class TestTransposedListOfImages(_TestTransposedArrayLike, ParametricTestCase):
 
-        a_as_array = numpy.array(self.images).transpose(transposition)
+    @classmethod
+    def setUpClass(cls):
+        super(TestTransposedListOfImages, cls).setUpClass()
 
-        # test the DatasetView.__array__ method
-        self.assertTrue(numpy.array_equal(
-                numpy.array(a),
-                a_as_array))
-
-        # test slicing
-        for selection in [(2, slice(None), slice(None)),
-                          (slice(None), 1, slice(0, 8)),
-                          (slice(0, 3), slice(None), 3),
-                          (1, 3, slice(None)),
-                          (slice(None), 2, 1),
-                          (4, slice(1, 9, 2), 2)]:
-            self.assertIsInstance(a[selection], numpy.ndarray)
-            self.assertTrue(numpy.array_equal(
-                    a[selection],
-                    a_as_array[selection]))
-
-        # test the DatasetView.__getitem__ for single values
-        # (step adjusted to test at least 3 indices in each dimension)
-        for i in range(0, a.shape[0], a.shape[0] // 3):
-            for j in range(0, a.shape[1], a.shape[1] // 3):
-                for k in range(0, a.shape[2], a.shape[2] // 3):
-                    viewed_value = a[i, j, k]
-                    sorted_indices = tuple(idx for (_, idx) in
-                                           sorted(zip(transposition, [i, j, k])))
-                    corresponding_original_value = self.images[sorted_indices[0]][sorted_indices[1:]]
-                    self.assertEqual(viewed_value,
-                                     corresponding_original_value)
-
-        # reversing the dimensions twice results in no change
-        rtrans = list(reversed(range(self.ndim)))
-        self.assertTrue(numpy.array_equal(
-                a,
-                a.transpose(rtrans).transpose(rtrans)))
-
-        # test .T property
-        self.assertTrue(numpy.array_equal(
-                a.T,
-                a.transpose(rtrans)))
-
-    def _testDoubleTransposition(self, transposition1, transposition2):
-        a = ListOfImages(self.images,
-                         transposition=transposition1).transpose(transposition2)
-
-        b = self.images_as_3D_array.transpose(transposition1).transpose(transposition2)
-
-        self.assertTrue(numpy.array_equal(a, b),
-                        "failed with double transposition %s %s" % (transposition1, transposition2))
-
-    def testTransposition012(self):
-        """transposition = (0, 1, 2)
-        (should be the same as testNoTransposition)"""
-        self._testTransposition((0, 1, 2))
-
-    def testTransposition021(self):
-        """transposition = (0, 2, 1)"""
-        self._testTransposition((0, 2, 1))
-
-    def testTransposition102(self):
-        """transposition = (1, 0, 2)"""
-        self._testTransposition((1, 0, 2))
-
-    def testTransposition120(self):
-        """transposition = (1, 2, 0)"""
-        self._testTransposition((1, 2, 0))
-
-    def testTransposition201(self):
-        """transposition = (2, 0, 1)"""
-        self._testTransposition((2, 0, 1))
-
-    def testTransposition210(self):
-        """transposition = (2, 1, 0)"""
-        self._testTransposition((2, 1, 0))
-
-    def testAllDoubleTranspositions(self):
-        for trans1 in self.all_permutations:
-            for trans2 in self.all_permutations:
-                self._testDoubleTransposition(trans1, trans2)
-
-    def test1DIndex(self):
-        a = ListOfImages(self.images)
-        self.assertTrue(numpy.array_equal(self.images[1],
-                                          a[1]))
+        cls.images = list(cls.volume)
 
-        b = ListOfImages(self.images, transposition=(1, 0, 2))
-        self.assertTrue(numpy.array_equal(self.images_as_3D_array[:, 1, :],
-                                          b[1]))
+    def _createView(self, transposition=None):
+        return ListOfImages(self.images, transposition=transposition)
 
 
 class TestFunctions(unittest.TestCase):
@@ -375,7 +266,7 @@ class TestFunctions(unittest.TestCase):
     def testListOfLists(self):
         l = [[0, 1, 2], [2, 3, 4]]
         self.assertEqual(get_dtype(l),
-                         numpy.dtype(int))
+                         _INT_DTYPE)
         self.assertEqual(get_shape(l),
                          (2, 3))
         self.assertTrue(is_nested_sequence(l))
@@ -384,7 +275,7 @@ class TestFunctions(unittest.TestCase):
 
         l = [[0., 1.], [2., 3.]]
         self.assertEqual(get_dtype(l),
-                         numpy.dtype(float))
+                         _FLOAT_DTYPE)
         self.assertEqual(get_shape(l),
                          (2, 2))
         self.assertTrue(is_nested_sequence(l))
@@ -396,7 +287,7 @@ class TestFunctions(unittest.TestCase):
              numpy.array([[0., 1., 2.], [2., 3., 4.]])]
 
         self.assertEqual(get_concatenated_dtype(l),
-                         numpy.array(l).dtype)
+                         _FLOAT_DTYPE)  # int is promoted to float
         self.assertEqual(get_shape(l),
                          (2, 2, 3))
         self.assertFalse(is_nested_sequence(l))
@@ -417,11 +308,11 @@ class TestFunctions(unittest.TestCase):
         tempdir = tempfile.mkdtemp()
         h5_fname = os.path.join(tempdir, "tempfile.h5")
         with h5py.File(h5_fname, "w") as h5f:
-            h5f["dataset"] = a
+            h5f.create_dataset("dataset", data=a, chunks=None)
             d = h5f["dataset"]
 
             self.assertEqual(get_dtype(d),
-                             numpy.dtype(int))
+                             _INT_DTYPE)
             self.assertFalse(is_nested_sequence(d))
             self.assertTrue(is_array(d))
             self.assertFalse(is_list_of_arrays(d))